@@ -8,22 +8,35 @@ This script demonstrates comprehensive LinkedIn scraping techniques including:
 - User-agent rotation
 - Proxy rotation support
 - Stealth techniques to avoid detection
-- HTML parsing for profile data extraction
+- Fast HTML parsing with lxml and precompiled XPath queries
+- Concurrent profile fetching with Playwright (optional)
+- Browserless HTML fetching with aiohttp and the session cookies (optional)
 
 Requirements:
-pip install selenium beautifulsoup4 lxml requests webdriver-manager
+pip install selenium lxml requests webdriver-manager playwright aiohttp orjson
+playwright install chromium
 
 Note: ChromeDriver is now automatically downloaded and managed!
 """
 
+import asyncio
+import csv
+import gzip
 import json
+import multiprocessing
+import multiprocessing.util
+import shutil
+import signal
 import time
 import random
-import pickle
 import os
+import re
+import subprocess
 import sys
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from typing import Callable, List, Dict, Optional
 from pathlib import Path
+from urllib.parse import urlsplit
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -31,8 +44,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, InvalidSessionIdException, NoSuchWindowException,
+    SessionNotCreatedException
+)
+import lxml.html
+from lxml import etree
 
 # Automatic ChromeDriver management
 try:
@@ -44,13 +61,85 @@ except ImportError:
     from webdriver_manager.chrome import ChromeDriverManager
     print("✓ webdriver_manager installed successfully")
 
+# Optional concurrent scraping with Playwright
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+    print("⚠ playwright not found - profiles will be scraped sequentially with Selenium")
+
+# Optional direct HTTP fetching of server-rendered profile pages
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+    print("⚠ aiohttp not found - every profile will be loaded in a browser")
+
+# Optional vectorized sampling of randomized delays
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional faster JSON encoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Local cache directory for data reused across runs
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'linkedin-scraper'
+
 
 class LinkedInScraper:
     """
     Advanced LinkedIn Profile Scraper with automatic ChromeDriver management
     """
     
-    def __init__(self, email: str, password: str, use_proxy: bool = False, proxy: Optional[str] = None):
+    # Single-pass tag index: tag -> (index key, attribute, substring) rules.
+    # The first element matching a rule is kept under its key.
+    _INDEX_RULES = {
+        'h1': (('name', 'class', 'text-heading-xlarge'),
+               ('name_alt', 'class', 'pv-text-details__left-panel')),
+        'div': (('headline', 'class', 'text-body-medium'),
+                ('about', 'class', 'pv-about')),
+        'span': (('location', 'class', 'text-body-small'),),
+        'section': (('experience', 'id', 'experience'),
+                    ('education', 'id', 'education'),
+                    ('skills', 'id', 'skills'))
+    }
+    
+    # One document walk selecting every element any index rule could match
+    _XP_INDEX = etree.XPath("//*[" + " or ".join(
+        "(self::%s and (%s))" % (tag, " or ".join(
+            "contains(@%s, '%s')" % (attribute, marker) for _, attribute, marker in rules
+        ))
+        for tag, rules in _INDEX_RULES.items()
+    ) + "]")
+    
+    # Precompiled XPath queries run inside indexed elements
+    _XP_ABOUT_TEXT = etree.XPath(".//div[contains(@class, 'inline-show-more-text')]")
+    _XP_CARDS = etree.XPath("(.//li[contains(@class, 'profile-section-card')])[position() <= $limit]")
+    _XP_SKILL_ITEMS = etree.XPath("(.//div[contains(@class, 'mr1')])[position() <= $limit]")
+    _XP_TITLE = etree.XPath(".//div[contains(@class, 'mr1')]")
+    _XP_SUBTITLE = etree.XPath(".//span[contains(@class, 't-14')]")
+    
+    # URL paths LinkedIn redirects to when a directly fetched page hits the sign-in wall
+    _AUTH_WALL_PATHS = ('/authwall', '/login', '/uas/login')
+    
+    # Static resources not needed for text extraction
+    _BLOCKED_URL_PATTERNS = [
+        '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg',
+        '*.css', '*.woff', '*.woff2', '*.ttf', '*.mp4',
+        '*static.licdn.com/media*'
+    ]
+    _BLOCKED_RESOURCE_TYPES = {'image', 'stylesheet', 'font', 'media'}
+    
+    # Major version prefix of a Chrome/ChromeDriver version string
+    _RE_CHROME_MAJOR = re.compile(r'(\d+)\.')
+    
+    def __init__(self, email: str, password: str, use_proxy: bool = False, proxy: Optional[str] = None,
+                 max_concurrency: int = 5, cookies_file: str = str(CACHE_DIR / 'cookies.json')):
         """
         Initialize the LinkedIn scraper
         
@@ -59,13 +148,17 @@ class LinkedInScraper:
             password: LinkedIn account password
             use_proxy: Whether to use a proxy
             proxy: Proxy address in format "ip:port" or "username:password@ip:port"
+            max_concurrency: Maximum number of profiles fetched at once with Playwright
+            cookies_file: JSON file used to persist the session cookies
         """
         self.email = email
         self.password = password
         self.use_proxy = use_proxy
         self.proxy = proxy
+        self.max_concurrency = max_concurrency
         self.driver = None
-        self.cookies_file = "linkedin_cookies.pkl"
+        self.cookies_file = cookies_file
+        self._delay_pool = iter(())
         
     def _get_random_user_agent(self) -> str:
         """Get a random user agent string"""
@@ -79,14 +172,15 @@ class LinkedInScraper:
         ]
         return random.choice(user_agents)
     
+    def _get_browser_user_agent(self) -> str:
+        """Get the user agent the Selenium browser actually reports"""
+        return self.driver.execute_script("return navigator.userAgent")
+    
     def _get_chrome_version(self) -> str:
         """
         Get the installed Chrome version
         Works on Windows, macOS, and Linux
         """
-        import subprocess
-        import re
-        
         try:
             if sys.platform == 'win32':
                 # Windows
@@ -128,6 +222,59 @@ class LinkedInScraper:
         
         return None
     
+    def _get_chrome_major_version(self) -> Optional[str]:
+        """Get the major version of the installed Chrome, e.g. '120'"""
+        version = self._get_chrome_version()
+        if version:
+            match = self._RE_CHROME_MAJOR.search(version)
+            if match:
+                return match.group(1)
+        return None
+    
+    def _chromedriver_matches(self, driver_path: str, chrome_major: str) -> bool:
+        """Check that a ChromeDriver binary runs and matches the Chrome major version"""
+        if not os.path.exists(driver_path):
+            return False
+        try:
+            result = subprocess.run([driver_path, '--version'], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        match = self._RE_CHROME_MAJOR.search(result.stdout)
+        return result.returncode == 0 and match is not None and match.group(1) == chrome_major
+    
+    def _get_chromedriver_path(self) -> str:
+        """
+        Get the ChromeDriver path, reusing the cached one from a previous run
+        when it still matches the installed Chrome major version
+        """
+        cache_file = CACHE_DIR / 'chromedriver_path.json'
+        chrome_major = self._get_chrome_major_version()
+        
+        cache = {}
+        if chrome_major and cache_file.exists():
+            try:
+                cache = json.loads(cache_file.read_text())
+            except (OSError, ValueError):
+                cache = {}
+            
+            cached_path = cache.get(chrome_major)
+            if cached_path and self._chromedriver_matches(cached_path, chrome_major):
+                print(f"✓ Using cached ChromeDriver for Chrome {chrome_major}: {cached_path}")
+                return cached_path
+        
+        print("→ Downloading matching ChromeDriver version...")
+        driver_path = ChromeDriverManager().install()
+        
+        if chrome_major:
+            cache[chrome_major] = driver_path
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(cache))
+            except OSError as e:
+                print(f"⚠ Could not cache ChromeDriver path: {str(e)}")
+        
+        return driver_path
+    
     def _setup_driver(self):
         """Setup Chrome driver with automatic ChromeDriver management and stealth options"""
         print("→ Setting up ChromeDriver with automatic version matching...")
@@ -155,9 +302,9 @@ class LinkedInScraper:
         # Disable extensions
         chrome_options.add_argument('--disable-extensions')
         
-        # Disable images for faster loading (optional - uncomment to enable)
-        # prefs = {"profile.managed_default_content_settings.images": 2}
-        # chrome_options.add_experimental_option("prefs", prefs)
+        # Disable images for faster loading - only the HTML text is scraped
+        prefs = {"profile.managed_default_content_settings.images": 2}
+        chrome_options.add_experimental_option("prefs", prefs)
         
         # Add proxy if provided
         if self.use_proxy and self.proxy:
@@ -166,22 +313,16 @@ class LinkedInScraper:
         
         try:
             # Automatic ChromeDriver download and setup
-            print("→ Downloading matching ChromeDriver version...")
-            service = Service(ChromeDriverManager().install())
+            service = Service(self._get_chromedriver_path())
             print(f"✓ ChromeDriver service initialized successfully")
             
             # Initialize driver with service
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             
-        except Exception as e:
+        except SessionNotCreatedException as e:
             print(f"✗ Error initializing ChromeDriver: {str(e)}")
-            print("→ Attempting fallback method...")
-            try:
-                # Fallback: Try to use ChromeDriver from PATH
-                self.driver = webdriver.Chrome(options=chrome_options)
-            except Exception as e2:
-                print(f"✗ Fallback also failed: {str(e2)}")
-                raise Exception("Could not initialize ChromeDriver. Please ensure Chrome is installed.")
+            print("→ Please ensure Chrome is installed and matches the ChromeDriver version")
+            raise
         
         # Execute script to mask webdriver property
         try:
@@ -196,48 +337,164 @@ class LinkedInScraper:
         except Exception as e:
             print(f"⚠ Could not activate full stealth mode: {str(e)}")
         
-        self.driver.implicitly_wait(10)
+        # Block heavy static resources (images, CSS, fonts, media); HTML is left untouched
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self._BLOCKED_URL_PATTERNS})
+            print("✓ Image, CSS, font and media downloads blocked")
+        except Exception as e:
+            print(f"⚠ Could not block static resources: {str(e)}")
+        
+        # Raise the WebDriver connection pool size, keeping Selenium's own
+        # timeout, certificate and proxy settings. The scraper itself only
+        # issues driver calls from one thread; this is headroom for callers
+        # that add concurrent ones (e.g. a watchdog thread).
+        try:
+            conn = self.driver.command_executor._conn
+            conn.connection_pool_kw['maxsize'] = 20
+            conn.clear()
+        except Exception as e:
+            print(f"⚠ Could not resize WebDriver connection pool: {str(e)}")
+        
+        # Leave room for the in-browser scroll loop in _scroll_slowly
+        self.driver.set_script_timeout(60)
+        
         print("✓ ChromeDriver setup complete!\n")
         
+    def _refill_delay_pool(self, size: int = 1024):
+        """Pre-sample a batch of uniform [0, 1) values for randomized delays"""
+        if np is not None:
+            samples = np.random.default_rng().random(size).tolist()
+        else:
+            samples = [random.random() for _ in range(size)]
+        self._delay_pool = iter(samples)
+    
+    def _random_delay(self, min_sec: float, max_sec: float) -> float:
+        """Get a random duration between min_sec and max_sec from the pre-sampled pool"""
+        fraction = next(self._delay_pool, None)
+        if fraction is None:
+            self._refill_delay_pool()
+            fraction = next(self._delay_pool)
+        return min_sec + (max_sec - min_sec) * fraction
+    
     def _random_sleep(self, min_sec: float = 2, max_sec: float = 5):
         """Sleep for a random duration to mimic human behavior"""
-        sleep_time = random.uniform(min_sec, max_sec)
-        time.sleep(sleep_time)
+        time.sleep(self._random_delay(min_sec, max_sec))
         
     def _human_like_typing(self, element, text: str):
-        """Type text in a human-like manner with random delays"""
-        for char in text:
-            element.send_keys(char)
-            time.sleep(random.uniform(0.05, 0.2))
+        """
+        Type text into an element followed by a human-like pause
+        
+        The whole string is inserted with one CDP Input.insertText command
+        rather than one send_keys round-trip per character.
+        """
+        element.click()
+        try:
+            self.driver.execute_cdp_cmd('Input.insertText', {'text': text})
+        except Exception as e:
+            print(f"⚠ CDP text input failed, using send_keys: {str(e)}")
+            element.send_keys(text)
+        self._random_sleep(0.3, 0.8)
     
-    def _scroll_slowly(self):
-        """Scroll the page slowly to mimic human behavior"""
+    def _scroll_slowly(self, max_duration: float = 45):
+        """
+        Scroll the page slowly to mimic human behavior
+        
+        The whole loop runs in the browser as one async script, so it costs a
+        single WebDriver round-trip instead of several per scroll step. It
+        finishes once the bottom is reached and the page stops growing.
+        """
         try:
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
-            viewport_height = self.driver.execute_script("return window.innerHeight")
-            
-            current_position = 0
-            while current_position < total_height:
-                # Random scroll distance
-                scroll_distance = random.randint(200, 400)
-                current_position += scroll_distance
-                
-                self.driver.execute_script(f"window.scrollTo(0, {current_position});")
-                self._random_sleep(0.5, 1.5)
-                
-                # Recalculate total height as content might have loaded
-                total_height = self.driver.execute_script("return document.body.scrollHeight")
-                
-                if current_position >= total_height:
-                    break
+            self.driver.execute_async_script("""
+                const deadline = Date.now() + arguments[0];
+                const done = arguments[arguments.length - 1];
+                let lastHeight = 0, unchanged = 0;
+                const step = () => {
+                    window.scrollBy(0, 200 + Math.random() * 200);
+                    const height = document.body.scrollHeight;
+                    // scrollY can be fractional at non-100% zoom or scale factors
+                    const atBottom = Math.ceil(window.innerHeight + window.scrollY) >= height - 2;
+                    if (atBottom && height === lastHeight) {
+                        if (++unchanged > 3) return done();
+                    } else {
+                        unchanged = 0;
+                        lastHeight = height;
+                    }
+                    if (Date.now() > deadline) return done();
+                    setTimeout(step, 500 + Math.random() * 1000);
+                };
+                step();
+            """, int(max_duration * 1000))
         except Exception as e:
             print(f"⚠ Error during scrolling: {str(e)}")
     
+    def _wait_for_dom_idle(self, quiet_ms: int = 800, max_wait: float = 3):
+        """
+        Wait until the page stops changing
+        
+        A MutationObserver resolves once no DOM mutations happened for
+        quiet_ms, so fast pages return right away instead of after a fixed
+        sleep. Gives up after max_wait seconds on pages that never settle
+        (LinkedIn keeps mutating the DOM), which matches the 2-3 s sleep
+        this replaced so the wait is never longer than before.
+        """
+        try:
+            self.driver.execute_async_script("""
+                const quietMs = arguments[0];
+                const done = arguments[arguments.length - 1];
+                let observer;
+                const finish = () => {
+                    observer.disconnect();
+                    clearTimeout(timer);
+                    clearTimeout(deadline);
+                    done();
+                };
+                let timer = setTimeout(finish, quietMs);
+                const deadline = setTimeout(finish, arguments[1]);
+                observer = new MutationObserver(() => {
+                    clearTimeout(timer);
+                    timer = setTimeout(finish, quietMs);
+                });
+                observer.observe(document.body, {childList: true, subtree: true});
+            """, quiet_ms, int(max_wait * 1000))
+        except Exception as e:
+            print(f"⚠ Error waiting for page to settle: {str(e)}")
+    
+    def _ensure_driver_alive(self):
+        """
+        Make sure the WebDriver session is still usable
+        
+        A dead session only recreates the driver and restores the saved
+        cookies, instead of going through a full login again.
+        """
+        if self.driver:
+            try:
+                if self.driver.session_id:
+                    _ = self.driver.current_url
+                    return
+            except (InvalidSessionIdException, NoSuchWindowException) as e:
+                print(f"⚠ WebDriver session lost: {str(e)}")
+            
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        
+        print("→ Restarting ChromeDriver and restoring session cookies...")
+        self._setup_driver()
+        self.load_cookies()
+        self.driver.refresh()
+    
     def save_cookies(self):
         """Save cookies to file for session persistence"""
         try:
+            cookies = self.driver.get_cookies()
+            Path(self.cookies_file).parent.mkdir(parents=True, exist_ok=True)
             with open(self.cookies_file, 'wb') as f:
-                pickle.dump(self.driver.get_cookies(), f)
+                if orjson is not None:
+                    f.write(orjson.dumps(cookies))
+                else:
+                    f.write(json.dumps(cookies).encode('utf-8'))
             print(f"✓ Cookies saved to {self.cookies_file}")
         except Exception as e:
             print(f"⚠ Error saving cookies: {str(e)}")
@@ -249,13 +506,14 @@ class LinkedInScraper:
             try:
                 self.driver.get("https://www.linkedin.com")
                 with open(self.cookies_file, 'rb') as f:
-                    cookies = pickle.load(f)
-                    for cookie in cookies:
-                        try:
-                            self.driver.add_cookie(cookie)
-                        except Exception as e:
-                            # Some cookies might fail, continue with others
-                            continue
+                    data = f.read()
+                cookies = orjson.loads(data) if orjson is not None else json.loads(data)
+                for cookie in cookies:
+                    try:
+                        self.driver.add_cookie(cookie)
+                    except Exception as e:
+                        # Some cookies might fail, continue with others
+                        continue
                 print("✓ Cookies loaded successfully")
                 return True
             except Exception as e:
@@ -301,7 +559,7 @@ class LinkedInScraper:
             self._random_sleep(1, 2)
             
             # Click login button
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+            login_button = self.driver.find_element(By.CSS_SELECTOR, 'button[type=submit]')
             login_button.click()
             
             print("→ Login button clicked, waiting for page load...")
@@ -337,28 +595,21 @@ class LinkedInScraper:
         print(f"→ Scraping profile: {profile_url}")
         
         try:
+            self._ensure_driver_alive()
+            
+            # Stop any pending loads from the previous profile, keep the session cookies
+            self.driver.execute_script("window.stop()")
             self.driver.get(profile_url)
-            self._random_sleep(3, 5)
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located((By.TAG_NAME, 'main'))
+            )
             
             # Scroll to load all content
             print("  → Scrolling to load content...")
             self._scroll_slowly()
-            self._random_sleep(2, 3)
+            self._wait_for_dom_idle()
             
-            # Get page source
-            soup = BeautifulSoup(self.driver.page_source, 'lxml')
-            
-            # Extract profile data
-            profile_data = {
-                'url': profile_url,
-                'name': self._extract_name(soup),
-                'headline': self._extract_headline(soup),
-                'location': self._extract_location(soup),
-                'about': self._extract_about(soup),
-                'experience': self._extract_experience(soup),
-                'education': self._extract_education(soup),
-                'skills': self._extract_skills(soup)
-            }
+            profile_data = self._parse_profile(self._get_page_html(), profile_url)
             
             print(f"✓ Successfully scraped profile: {profile_data.get('name', 'Unknown')}")
             return profile_data
@@ -367,70 +618,159 @@ class LinkedInScraper:
             print(f"✗ Error scraping profile {profile_url}: {str(e)}")
             return {'url': profile_url, 'error': str(e)}
     
-    def _extract_name(self, soup: BeautifulSoup) -> str:
+    def _get_page_html(self) -> str:
+        """Get the current page HTML over CDP, falling back to page_source"""
+        try:
+            result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': 'document.documentElement.outerHTML',
+                'returnByValue': True
+            })
+            return result['result']['value']
+        except Exception as e:
+            print(f"⚠ Could not read page HTML over CDP: {str(e)}")
+            return self.driver.page_source
+    
+    async def scrape_profile_async(self, context, profile_url: str) -> Dict:
+        """
+        Scrape a LinkedIn profile in a Playwright browser context
+        
+        Args:
+            context: Logged-in Playwright BrowserContext
+            profile_url: URL of the LinkedIn profile
+            
+        Returns:
+            Dictionary containing profile data
+        """
+        print(f"→ Scraping profile: {profile_url}")
+        
+        page = await context.new_page()
+        try:
+            await page.goto(profile_url)
+            await page.wait_for_load_state("networkidle")
+            
+            # Scroll to the bottom so lazy-loaded sections are rendered
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await page.wait_for_load_state("networkidle")
+            
+            profile_data = self._parse_profile(await page.content(), profile_url)
+            
+            print(f"✓ Successfully scraped profile: {profile_data.get('name', 'Unknown')}")
+            return profile_data
+            
+        except Exception as e:
+            print(f"✗ Error scraping profile {profile_url}: {str(e)}")
+            return {'url': profile_url, 'error': str(e)}
+        finally:
+            await page.close()
+    
+    def _parse_profile(self, html: str, profile_url: str) -> Dict:
+        """Extract profile data from the page HTML"""
+        index = self._index_profile(lxml.html.document_fromstring(html))
+        
+        return {
+            'url': profile_url,
+            'name': self._extract_name(index),
+            'headline': self._extract_headline(index),
+            'location': self._extract_location(index),
+            'about': self._extract_about(index),
+            'experience': self._extract_experience(index),
+            'education': self._extract_education(index),
+            'skills': self._extract_skills(index)
+        }
+    
+    def _index_profile(self, tree: lxml.html.HtmlElement) -> Dict[str, lxml.html.HtmlElement]:
+        """
+        Walk the document once and index the first element matching each rule
+        
+        The extractors look their elements up in this index instead of each
+        traversing the whole tree again.
+        """
+        index = {}
+        for element in self._XP_INDEX(tree):
+            for key, attribute, marker in self._INDEX_RULES[element.tag]:
+                if key not in index and marker in (element.get(attribute) or ''):
+                    index[key] = element
+        return index
+    
+    @staticmethod
+    def _text(element: Optional[lxml.html.HtmlElement]) -> Optional[str]:
+        """Return the stripped text of an element, or None if it is missing"""
+        if element is None:
+            return None
+        return element.text_content().strip()
+    
+    @staticmethod
+    def _first_text(xpath: etree.XPath, node) -> Optional[str]:
+        """Return the stripped text of the first node matched by xpath"""
+        matches = xpath(node)
+        if matches:
+            return matches[0].text_content().strip()
+        return None
+    
+    def _extract_name(self, index: Dict) -> str:
         """Extract name from profile"""
         try:
             # Try multiple selectors
-            name_element = soup.find('h1', class_=lambda x: x and 'text-heading-xlarge' in x)
-            if name_element:
-                return name_element.get_text().strip()
+            name = self._text(index.get('name'))
+            if name is not None:
+                return name
             
             # Alternative selector
-            name_element = soup.find('h1', class_='pv-text-details__left-panel')
-            if name_element:
-                return name_element.get_text().strip()
+            name = self._text(index.get('name_alt'))
+            if name is not None:
+                return name
                 
         except Exception as e:
             pass
         return "N/A"
     
-    def _extract_headline(self, soup: BeautifulSoup) -> str:
+    def _extract_headline(self, index: Dict) -> str:
         """Extract headline/title from profile"""
         try:
-            headline = soup.find('div', class_=lambda x: x and 'text-body-medium' in x)
-            if headline:
-                return headline.get_text().strip()
+            headline = self._text(index.get('headline'))
+            if headline is not None:
+                return headline
         except Exception as e:
             pass
         return "N/A"
     
-    def _extract_location(self, soup: BeautifulSoup) -> str:
+    def _extract_location(self, index: Dict) -> str:
         """Extract location from profile"""
         try:
-            location = soup.find('span', class_=lambda x: x and 'text-body-small' in x)
-            if location:
-                return location.get_text().strip()
+            location = self._text(index.get('location'))
+            if location is not None:
+                return location
         except Exception as e:
             pass
         return "N/A"
     
-    def _extract_about(self, soup: BeautifulSoup) -> str:
+    def _extract_about(self, index: Dict) -> str:
         """Extract about section from profile"""
         try:
-            about_section = soup.find('div', class_=lambda x: x and 'pv-about' in x if x else False)
-            if about_section:
-                about_text = about_section.find('div', class_=lambda x: x and 'inline-show-more-text' in x if x else False)
-                if about_text:
-                    return about_text.get_text().strip()
+            about_section = index.get('about')
+            if about_section is not None:
+                about = self._first_text(self._XP_ABOUT_TEXT, about_section)
+                if about is not None:
+                    return about
         except Exception as e:
             pass
         return "N/A"
     
-    def _extract_experience(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_experience(self, index: Dict) -> List[Dict]:
         """Extract experience section from profile"""
         experiences = []
         try:
-            exp_section = soup.find('section', {'id': lambda x: x and 'experience' in x if x else False})
-            if exp_section:
-                exp_items = exp_section.find_all('li', class_=lambda x: x and 'profile-section-card' in x if x else False)
-                for item in exp_items[:5]:  # Limit to first 5
+            exp_section = index.get('experience')
+            if exp_section is not None:
+                exp_items = self._XP_CARDS(exp_section, limit=5)  # Limit to first 5
+                for item in exp_items:
                     try:
-                        title = item.find('div', class_=lambda x: x and 'mr1' in x if x else False)
-                        company = item.find('span', class_=lambda x: x and 't-14' in x if x else False)
+                        title = self._first_text(self._XP_TITLE, item)
+                        company = self._first_text(self._XP_SUBTITLE, item)
                         
                         exp_data = {
-                            'title': title.get_text().strip() if title else 'N/A',
-                            'company': company.get_text().strip() if company else 'N/A'
+                            'title': title if title is not None else 'N/A',
+                            'company': company if company is not None else 'N/A'
                         }
                         experiences.append(exp_data)
                     except:
@@ -439,21 +779,21 @@ class LinkedInScraper:
             pass
         return experiences
     
-    def _extract_education(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_education(self, index: Dict) -> List[Dict]:
         """Extract education section from profile"""
         education = []
         try:
-            edu_section = soup.find('section', {'id': lambda x: x and 'education' in x if x else False})
-            if edu_section:
-                edu_items = edu_section.find_all('li', class_=lambda x: x and 'profile-section-card' in x if x else False)
-                for item in edu_items[:3]:  # Limit to first 3
+            edu_section = index.get('education')
+            if edu_section is not None:
+                edu_items = self._XP_CARDS(edu_section, limit=3)  # Limit to first 3
+                for item in edu_items:
                     try:
-                        school = item.find('div', class_=lambda x: x and 'mr1' in x if x else False)
-                        degree = item.find('span', class_=lambda x: x and 't-14' in x if x else False)
+                        school = self._first_text(self._XP_TITLE, item)
+                        degree = self._first_text(self._XP_SUBTITLE, item)
                         
                         edu_data = {
-                            'school': school.get_text().strip() if school else 'N/A',
-                            'degree': degree.get_text().strip() if degree else 'N/A'
+                            'school': school if school is not None else 'N/A',
+                            'degree': degree if degree is not None else 'N/A'
                         }
                         education.append(edu_data)
                     except:
@@ -462,96 +802,296 @@ class LinkedInScraper:
             pass
         return education
     
-    def _extract_skills(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_skills(self, index: Dict) -> List[str]:
         """Extract skills from profile"""
         skills = []
         try:
-            skills_section = soup.find('section', {'id': lambda x: x and 'skills' in x if x else False})
-            if skills_section:
-                skill_items = skills_section.find_all('div', class_=lambda x: x and 'mr1' in x if x else False)
-                for item in skill_items[:10]:  # Limit to first 10
-                    skill_text = item.get_text().strip()
+            skills_section = index.get('skills')
+            if skills_section is not None:
+                skill_items = self._XP_SKILL_ITEMS(skills_section, limit=10)  # Limit to first 10
+                for item in skill_items:
+                    skill_text = item.text_content().strip()
                     if skill_text:
                         skills.append(skill_text)
         except Exception as e:
             pass
         return skills
     
-    def scrape_multiple_profiles(self, profile_urls: List[str], output_file: str = "linkedin_profiles.csv"):
+    def scrape_multiple_profiles(self, profile_urls: List[str], output_file: str = "linkedin_profiles.csv",
+                                 processes: int = 1) -> Dict[str, int]:
         """
-        Scrape multiple profiles and save to CSV
+        Scrape multiple profiles and stream them to gzip-compressed CSV and JSON Lines
+        
+        Profiles are first fetched concurrently over plain HTTP with the session
+        cookies when aiohttp is installed. Pages that hit the auth wall are then
+        loaded in a browser: across a pool of Chrome processes when processes > 1,
+        concurrently with Playwright when it is installed, otherwise sequentially
+        with the Selenium driver. Each profile is written out as soon as it is
+        scraped, in completion order.
         
         Args:
             profile_urls: List of profile URLs to scrape
-            output_file: Output CSV filename
+            output_file: Output CSV filename, saved as <output_file>.gz
+            processes: Number of worker processes, each with its own Chrome driver
+            
+        Returns:
+            Counts of total, successful and failed profiles
         """
-        all_profiles = []
+        # The HTTP and Playwright paths read the session cookies from the driver
+        self._ensure_driver_alive()
+        
         successful = 0
         failed = 0
         
+        with self._open_outputs(output_file) as write_profile:
+            
+            def on_profile(profile_data: Dict):
+                nonlocal successful, failed
+                write_profile(profile_data)
+                if 'error' in profile_data:
+                    failed += 1
+                else:
+                    successful += 1
+            
+            # Fetch server-rendered profile pages directly, without a browser
+            remaining = profile_urls
+            if aiohttp is not None:
+                print(f"→ Fetching {len(profile_urls)} profiles over HTTP "
+                      f"({self.max_concurrency} at a time)...")
+                remaining = asyncio.run(self._fetch_profiles_static(profile_urls, on_profile))
+            
+            # Anything behind the auth wall or not server-rendered goes through a browser
+            if remaining:
+                if processes > 1:
+                    self._scrape_profiles_pool(remaining, processes, on_profile)
+                elif async_playwright is not None:
+                    print(f"→ Scraping {len(remaining)} profiles with Playwright "
+                          f"({self.max_concurrency} at a time)...")
+                    asyncio.run(self._scrape_profiles_async(remaining, on_profile))
+                else:
+                    self._scrape_profiles_sequential(remaining, on_profile)
+        
+        print(f"\n{'='*70}")
+        print(f"Scraping Complete!")
+        print(f"{'='*70}")
+        print(f"Total profiles processed: {len(profile_urls)}")
+        print(f"Successful: {successful}")
+        print(f"Failed: {failed}")
+        print(f"Success rate: {(successful/len(profile_urls)*100):.1f}%")
+        
+        return {'total': len(profile_urls), 'successful': successful, 'failed': failed}
+    
+    async def _fetch_profiles_static(self, profile_urls: List[str],
+                                     on_profile: Callable[[Dict], None]) -> List[str]:
+        """
+        Fetch and parse profile HTML concurrently with aiohttp using the logged-in cookies
+        
+        Returns:
+            URLs of the profiles that have to be loaded in a browser instead
+        """
+        cookies = {cookie['name']: cookie['value'] for cookie in self.driver.get_cookies()}
+        headers = {'User-Agent': self._get_browser_user_agent()}
+        proxy = f"http://{self.proxy}" if self.use_proxy and self.proxy else None
+        timeout = aiohttp.ClientTimeout(total=30)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async with aiohttp.ClientSession(cookies=cookies, headers=headers, timeout=timeout) as session:
+            
+            async def fetch(url: str) -> Optional[str]:
+                async with semaphore:
+                    try:
+                        async with session.get(url, proxy=proxy) as response:
+                            html = await response.text()
+                            if response.status != 200 or self._is_auth_wall(str(response.url), html):
+                                print(f"⚠ {url} needs a browser (HTTP {response.status})")
+                                return url
+                    except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError) as e:
+                        print(f"⚠ Could not fetch {url}: {str(e)}")
+                        return url
+                
+                try:
+                    profile_data = self._parse_profile(html, url)
+                except Exception as e:
+                    # e.g. lxml raises ParserError on an empty body
+                    print(f"⚠ Could not parse {url}: {str(e)}")
+                    return url
+                if profile_data['name'] == "N/A":
+                    return url
+                
+                print(f"✓ Successfully scraped profile: {profile_data['name']}")
+                on_profile(profile_data)
+                return None
+            
+            results = await asyncio.gather(*[fetch(url) for url in profile_urls])
+            return [url for url in results if url is not None]
+    
+    def _is_auth_wall(self, final_url: str, html: str) -> bool:
+        """Check whether a directly fetched page is LinkedIn's sign-in wall"""
+        if urlsplit(final_url).path.startswith(self._AUTH_WALL_PATHS):
+            return True
+        return 'auth-wall' in html or 'authwall' in html
+    
+    def _scrape_profiles_sequential(self, profile_urls: List[str], on_profile: Callable[[Dict], None]):
+        """Scrape profiles one at a time with the Selenium driver"""
         for i, url in enumerate(profile_urls, 1):
             print(f"\n{'='*70}")
             print(f"Processing profile {i}/{len(profile_urls)}")
             print(f"{'='*70}")
             
-            profile_data = self.scrape_profile(url)
-            all_profiles.append(profile_data)
-            
-            if 'error' in profile_data:
-                failed += 1
-            else:
-                successful += 1
+            on_profile(self.scrape_profile(url))
             
             # Random delay between profiles
             if i < len(profile_urls):
-                delay = random.uniform(5, 10)
+                delay = self._random_delay(5, 10)
                 print(f"→ Waiting {delay:.1f} seconds before next profile...")
                 time.sleep(delay)
+    
+    def _scrape_profiles_pool(self, profile_urls: List[str], processes: int,
+                              on_profile: Callable[[Dict], None]):
+        """
+        Scrape profiles across a pool of worker processes
         
-        # Save to CSV
-        self._save_to_csv(all_profiles, output_file)
+        Selenium drivers are not thread-safe, but independent processes each
+        driving their own Chrome can work in parallel. Every worker logs in once
+        with its own copy of the session cookies and reuses its driver. Workers
+        quit their browser and delete that copy on exit, also when the pool is
+        terminated after an error.
+        """
+        print(f"→ Scraping {len(profile_urls)} profiles across {processes} Chrome processes...")
         
-        print(f"\n{'='*70}")
-        print(f"Scraping Complete!")
-        print(f"{'='*70}")
-        print(f"Total profiles processed: {len(profile_urls)}")
-        print(f"Successful: {successful}")
-        print(f"Failed: {failed}")
-        print(f"Success rate: {(successful/len(profile_urls)*100):.1f}%")
+        pool = multiprocessing.Pool(
+            processes,
+            initializer=_worker_init,
+            initargs=(self.email, self.password, self.use_proxy, self.proxy, self.cookies_file)
+        )
+        try:
+            for profile_data in pool.imap_unordered(_worker_scrape, profile_urls):
+                on_profile(profile_data)
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+    
+    async def _scrape_profiles_async(self, profile_urls: List[str], on_profile: Callable[[Dict], None]):
+        """
+        Scrape profiles concurrently with Playwright
         
-        return all_profiles
+        A single browser is shared by up to max_concurrency contexts, each
+        seeded with the cookies of the logged-in Selenium session so login()
+        only runs once.
+        """
+        storage_state = self._get_storage_state()
+        # Present the logged-in session with the same browser identity everywhere
+        user_agent = self._get_browser_user_agent()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        launch_args = {
+            'headless': False,
+            'args': ['--disable-blink-features=AutomationControlled', '--disable-notifications']
+        }
+        if self.use_proxy and self.proxy:
+            launch_args['proxy'] = {'server': self.proxy}
+        
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(**launch_args)
+            
+            async def block_static_resources(route):
+                if route.request.resource_type in self._BLOCKED_RESOURCE_TYPES:
+                    await route.abort()
+                else:
+                    await route.continue_()
+            
+            started = 0
+            
+            async def bounded(url: str):
+                nonlocal started
+                async with semaphore:
+                    started += 1
+                    context = await browser.new_context(
+                        storage_state=storage_state,
+                        user_agent=user_agent,
+                        viewport={'width': 1920, 'height': 1080}
+                    )
+                    await context.route('**/*', block_static_resources)
+                    try:
+                        profile_data = await self.scrape_profile_async(context, url)
+                    finally:
+                        await context.close()
+                    on_profile(profile_data)
+                    
+                    # Random delay before this slot picks up the next profile, if any
+                    if started < len(profile_urls):
+                        await asyncio.sleep(self._random_delay(5, 10))
+            
+            try:
+                await asyncio.gather(*[bounded(url) for url in profile_urls])
+            finally:
+                await browser.close()
+    
+    def _get_storage_state(self) -> Dict:
+        """Convert the Selenium session cookies into a Playwright storage state"""
+        cookies = []
+        for cookie in self.driver.get_cookies():
+            pw_cookie = {
+                'name': cookie['name'],
+                'value': cookie['value'],
+                'domain': cookie.get('domain', '.linkedin.com'),
+                'path': cookie.get('path', '/'),
+                'expires': cookie.get('expiry', -1),
+                'httpOnly': cookie.get('httpOnly', False),
+                'secure': cookie.get('secure', False)
+            }
+            if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+                pw_cookie['sameSite'] = cookie['sameSite']
+            cookies.append(pw_cookie)
+        return {'cookies': cookies, 'origins': []}
     
-    def _save_to_csv(self, profiles: List[Dict], filename: str):
-        """Save profile data to CSV file"""
-        import csv
+    @contextmanager
+    def _open_outputs(self, output_file: str):
+        """
+        Open the gzip-compressed CSV and JSON Lines outputs for streaming
         
-        if not profiles:
-            print("✗ No profiles to save")
-            return
+        Yields a function that appends one profile to both files and flushes
+        them, so every scraped profile is on disk without holding all of them
+        in memory.
+        """
+        csv_path = output_file if output_file.endswith('.gz') else f"{output_file}.gz"
+        jsonl_path = re.sub(r'(\.csv)?\.gz$', '', csv_path) + '.jsonl.gz'
         
         # Define CSV columns
         columns = ['url', 'name', 'headline', 'location', 'about']
         
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
-                writer.writeheader()
-                
-                for profile in profiles:
-                    # Flatten experience and education
-                    row = {
-                        'url': profile.get('url', ''),
-                        'name': profile.get('name', ''),
-                        'headline': profile.get('headline', ''),
-                        'location': profile.get('location', ''),
-                        'about': profile.get('about', '')[:500] if profile.get('about') else ''
-                    }
-                    writer.writerow(row)
+        with gzip.open(csv_path, 'wt', newline='', encoding='utf-8') as csv_file, \
+                gzip.open(jsonl_path, 'wb') as jsonl_file:
+            writer = csv.DictWriter(csv_file, fieldnames=columns, extrasaction='ignore')
+            writer.writeheader()
             
-            print(f"\n✓ Successfully saved {len(profiles)} profiles to {filename}")
+            def write_profile(profile: Dict):
+                writer.writerow({
+                    'url': profile.get('url', ''),
+                    'name': profile.get('name', ''),
+                    'headline': profile.get('headline', ''),
+                    'location': profile.get('location', ''),
+                    'about': (profile.get('about') or '')[:500]
+                })
+                if orjson is not None:
+                    jsonl_file.write(orjson.dumps(profile) + b'\n')
+                else:
+                    jsonl_file.write(json.dumps(profile, ensure_ascii=False).encode('utf-8') + b'\n')
+                csv_file.flush()
+                jsonl_file.flush()
             
-        except Exception as e:
-            print(f"✗ Error saving to CSV: {str(e)}")
+            yield write_profile
+        
+        print(f"\n✓ Saved profiles to {csv_path} and {jsonl_path}")
+    
+    def logout(self):
+        """Clear the browser session cookies"""
+        if self.driver:
+            self.driver.delete_all_cookies()
+            print("✓ Session cookies cleared")
     
     def close(self):
         """Close the browser"""
@@ -560,6 +1100,86 @@ class LinkedInScraper:
             print("\n✓ Browser closed")
 
 
+# ============================================================================
+# PARALLEL WORKERS
+# ============================================================================
+
+# Scraper owned by the current pool worker process, and its cleanup finalizer
+_SCRAPER = None
+_WORKER_FINALIZER = None
+# Whether the current worker has already scraped a profile
+_WORKER_BUSY = False
+
+
+def _worker_cleanup(scraper: 'LinkedInScraper', worker_cookies: Path):
+    """Quit the worker's browser and remove its copy of the session cookies"""
+    try:
+        scraper.close()
+    except Exception as e:
+        print(f"⚠ Worker {os.getpid()} could not close the browser: {str(e)}")
+    try:
+        worker_cookies.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _worker_terminate(signum, frame):
+    """Clean up before exiting when Pool.terminate() sends SIGTERM"""
+    if _WORKER_FINALIZER is not None:
+        _WORKER_FINALIZER()
+    os._exit(0)
+
+
+def _worker_init(email: str, password: str, use_proxy: bool, proxy: Optional[str], cookies_file: str):
+    """Create and log in the scraper for a pool worker process"""
+    global _SCRAPER, _WORKER_FINALIZER
+    
+    # Each worker gets its own cookie file, seeded from the parent's session
+    cookies_path = Path(cookies_file)
+    worker_cookies = cookies_path.with_name(f"{cookies_path.stem}_{os.getpid()}{cookies_path.suffix}")
+    if cookies_path.exists() and not worker_cookies.exists():
+        shutil.copyfile(cookies_path, worker_cookies)
+    
+    scraper = LinkedInScraper(
+        email=email,
+        password=password,
+        use_proxy=use_proxy,
+        proxy=proxy,
+        cookies_file=str(worker_cookies)
+    )
+    
+    # Quit the worker's browser and delete its cookie copy when the pool shuts
+    # down, including on Pool.terminate(). On Windows terminate() kills the
+    # worker without a signal, so its Chrome may be left running there.
+    _WORKER_FINALIZER = multiprocessing.util.Finalize(
+        None, _worker_cleanup, args=(scraper, worker_cookies), exitpriority=10
+    )
+    signal.signal(signal.SIGTERM, _worker_terminate)
+    
+    try:
+        scraper.login()
+    except Exception as e:
+        print(f"✗ Worker {os.getpid()} could not log in: {str(e)}")
+        return
+    
+    _SCRAPER = scraper
+
+
+def _worker_scrape(profile_url: str) -> Dict:
+    """Scrape a single profile with the worker's scraper"""
+    global _WORKER_BUSY
+    
+    if _SCRAPER is None:
+        return {'url': profile_url, 'error': 'Worker login failed'}
+    
+    # Random delay between this worker's profiles, none before its first one
+    if _WORKER_BUSY:
+        _SCRAPER._random_sleep(5, 10)
+    _WORKER_BUSY = True
+    
+    return _SCRAPER.scrape_profile(profile_url)
+
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
@@ -602,6 +1222,9 @@ def main():
     USE_PROXY = False
     PROXY = None  # Format: "ip:port" or "username:password@ip:port"
     
+    # Optional: Number of Chrome processes for browser scraping (1 = single driver)
+    NUM_PROCESSES = 1
+    
     # Initialize scraper
     scraper = LinkedInScraper(
         email=LINKEDIN_EMAIL,
@@ -614,13 +1237,8 @@ def main():
         # Login
         scraper.login()
         
-        # Scrape profiles
-        profiles = scraper.scrape_multiple_profiles(PROFILE_URLS)
-        
-        # Also save as JSON for reference
-        with open('linkedin_profiles.json', 'w', encoding='utf-8') as f:
-            json.dump(profiles, f, indent=2, ensure_ascii=False)
-        print("✓ Also saved to linkedin_profiles.json")
+        # Scrape profiles, streaming them to linkedin_profiles.csv.gz and linkedin_profiles.jsonl.gz
+        scraper.scrape_multiple_profiles(PROFILE_URLS, processes=NUM_PROCESSES)
         
     except KeyboardInterrupt:
         print("\n⚠ Scraping interrupted by user")